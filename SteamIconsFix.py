@@ -49,14 +49,24 @@ SOFTWARE.
 
 # Import necessary libraries
 import os
-import io
 import time
+import asyncio
+import json
 import zipfile
+import shutil
+import tempfile
+import threading
 import re
 import sys
+import functools
 import requests
 import subprocess
 import winreg
+from concurrent.futures import ThreadPoolExecutor
+import httpx
+import aiofiles
+import gevent
+from gevent.pool import Pool
 from steam.client import SteamClient
 from steam.enums import EResult
 from steam.enums.emsg import EMsg
@@ -64,35 +74,149 @@ from steam.enums.emsg import EMsg
 # Import progress bar library
 from tqdm import tqdm
 
+# (connect, read) timeouts in seconds for all HTTP requests
+HTTP_TIMEOUT = (5, 30)
+
+# Maximum number of icons downloaded at the same time
+MAX_CONCURRENT_DOWNLOADS = 16
+
+# Size in bytes of the chunks icons are written to disk in
+ICON_CHUNK_SIZE = 64 * 1024
+
+USER_AGENT = "SteamIconsFix"
+
+# Maximum number of app IDs sent to the Steam API in a single product info request
+PRODUCT_INFO_CHUNK_SIZE = 200
+
+# Maximum number of product info requests in flight at the same time
+PRODUCT_INFO_CONCURRENCY = 4
+
+# Cached client icon file names older than this (in seconds) are fetched from Steam again
+CACHE_MAX_AGE = 7 * 24 * 60 * 60
+
+# SteamCMD arguments with a fixed count of +ggs. This is to let SteamCMD update itself
+# and then update the app_info_print command to get the latest info
+GGS = ["+gg"] * 10
+
+# Seconds after which a SteamCMD app info lookup is killed
+STEAMCMD_TIMEOUT = 60
+
+# Regex to extract the app ID and game name from a Steam app manifest (.acf) file in a single pass
+ACF_RE = re.compile(rb'"appid"\s+"(\d+)".*?"name"\s+"([^"]*)"', re.DOTALL)
+
+# Regex to extract the library folder paths from libraryfolders.vdf
+VDF_PATH_RE = re.compile(r'"path"\s+"([^"]+)"')
+
+# Number of .acf files read at the same time
+MAX_ACF_READERS = 16
+
+
+# Function to create the HTTP session used to download SteamCMD (icons are downloaded with httpx)
+def create_http_session():
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+
+    return session
+
+
+# Function to get the path of the client icon cache file
+def get_cache_file_path():
+    local_app_data = os.getenv("LOCALAPPDATA") or os.path.expanduser("~")
+    return os.path.join(local_app_data, "SteamIconsFix", "cache.json")
+
+
+# Function to load the client icon cache, returns an empty cache if there is none or it is unreadable
+def load_cache():
+    try:
+        with open(get_cache_file_path(), "r", encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+# Function to save the client icon cache to disk
+def save_cache(cache):
+    cache_file_path = get_cache_file_path()
+    try:
+        os.makedirs(os.path.dirname(cache_file_path), exist_ok=True)
+        with open(cache_file_path, "w", encoding="utf-8") as file:
+            json.dump(cache, file)
+    except OSError as err:
+        print("Failed to save the client icon cache: ", err)
+
+
+# Function to get a client icon file name from the cache, returns None if it is missing or too old
+def get_cached_client_icon(cache, app_id):
+    entry = cache.get(app_id)
+    if entry and time.time() - entry.get("fetched_at", 0) < CACHE_MAX_AGE:
+        return entry.get("clienticon")
+    return None
+
+
+# Function to store a client icon file name in the cache
+def set_cached_client_icon(cache, app_id, client_icon_filename):
+    cache[app_id] = {"clienticon": client_icon_filename, "fetched_at": time.time()}
+
+
+# Function to extract a ZIP file with its members decompressed in parallel
+def extract_zip_parallel(zip_path, path):
+    with zipfile.ZipFile(zip_path) as zip_file:
+        members = zip_file.infolist()
+
+        # Create all directories up front so the worker threads don't race to create them
+        for member in members:
+            parent = member.filename.rstrip("/").rpartition("/")[0]
+            if parent:
+                zip_file.extract(zipfile.ZipInfo(parent + "/"), path)
+            if member.is_dir():
+                zip_file.extract(member, path)
+
+    file_names = [member.filename for member in members if not member.is_dir()]
+    if not file_names:
+        return
+
+    # ZipFile is not safe for shared reads, so each worker thread opens its own handle
+    thread_local = threading.local()
+    zip_files = []
+
+    def extract_member(name):
+        if not hasattr(thread_local, "zip_file"):
+            thread_local.zip_file = zipfile.ZipFile(zip_path)
+            zip_files.append(thread_local.zip_file)
+        thread_local.zip_file.extract(name, path)
+
+    try:
+        with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, len(file_names))) as executor:
+            list(executor.map(extract_member, file_names))
+    finally:
+        for zip_file in zip_files:
+            zip_file.close()
+
+
 # Import ZIP file library
-def download_and_extract(url, path):
+def download_and_extract(session, url, path):
     # Check if the directory exists and is writeable
     if not os.path.isdir(path) or not os.access(path, os.W_OK):
         raise Exception("The path is either not a directory or is not writeable: %s" % path)
 
     try:
-        # Send GET request
-        response = requests.get(url)
-
-        # Check if the request is successful
-        if response.status_code != 200:
-            raise Exception("Failed to download the file. URL: %s" % url)
+        # Send GET request and stream the response instead of loading it into memory
+        with session.get(url, stream=True, timeout=HTTP_TIMEOUT) as response:
 
-        # Read content of the request
-        content = response.content
+            # Check if the request is successful
+            if response.status_code != 200:
+                raise Exception("Failed to download the file. URL: %s" % url)
 
-        # Convert content to a stream
-        zip_stream = io.BytesIO(content)
+            # Write the content to a temporary file that the extraction threads can each open
+            with tempfile.TemporaryDirectory() as temp_dir:
+                zip_path = os.path.join(temp_dir, "download.zip")
+                with open(zip_path, "wb") as zip_stream:
+                    response.raw.decode_content = True
+                    shutil.copyfileobj(response.raw, zip_stream)
 
-        # Open the ZIP file
-        zip_file = zipfile.ZipFile(zip_stream)
-
-        # Check if zip file is valid
-        if zip_file.testzip() is not None:
-            raise Exception("The downloaded file is not a valid zip file: %s" % url)
-
-        # Extract the ZIP file content to disk
-        zip_file.extractall(path)
+                # Extract the ZIP file content to disk
+                # (no testzip() needed, extraction raises BadZipFile on a bad CRC)
+                extract_zip_parallel(zip_path, path)
 
     except requests.RequestException as err:
         print ("A requests exception occurred: ",err)
@@ -103,6 +227,7 @@ def download_and_extract(url, path):
 
 
 # Function to find Steam installation path
+@functools.lru_cache(maxsize=1)
 def find_steam_installation():
     try:
         registry_key = winreg.OpenKey(
@@ -116,7 +241,8 @@ def find_steam_installation():
         return None
 
 
-# Function to retrieve Steam library folders
+# Function to retrieve Steam library folders, the result is a tuple as it is cached
+@functools.lru_cache(maxsize=1)
 def get_steam_library_folders(steamPath):
     # Empty list to store library folder paths
     library_folders = []
@@ -130,33 +256,110 @@ def get_steam_library_folders(steamPath):
     # If the VDF file exists, read it and extract library folder paths
     if os.path.exists(vdf_file_path):
         with open(vdf_file_path, "r", encoding="utf-8") as file:
-            lines = file.readlines()
+            vdf_content = file.read()
+
+        # Loop over each "path" value in the VDF file
+        for path in VDF_PATH_RE.findall(vdf_content):
+            # Remove escape characters in the path
+            path = path.replace("\\\\", "\\")
+
+            # Append "/steamapps" to the path
+            path = os.path.join(path, "steamapps")
+
+            # Add the path to the list of library folders if it exists
+            if os.path.exists(path):
+                library_folders.append(path)
+
+    # Return the library folders
+    return tuple(library_folders)
+
 
-        # Loop over each line in the VDF file
-        for line in lines:
-            # If the line contains the string "path", extract the path
-            if "path" in line:
-                path = line.strip()
+# Function to build the CDN URL of a client icon
+def get_client_icon_url(app_id, client_icon_filename):
+    return f"https://cdn.cloudflare.steamstatic.com/steamcommunity/public/images/apps/{app_id}/{client_icon_filename}.ico"
 
-                # Extract the path value in the second pair of quotation marks
-                path = path.split('"')[3]
 
-                # Remove escape characters in the path
-                path = path.replace("\\\\", "\\")
+# Function to get the path a client icon is saved to
+def get_icon_file_path(steamcmd_install_dir, client_icon_filename):
+    return os.path.join(steamcmd_install_dir, "steam", "games", f"{client_icon_filename}.ico")
 
-                # Append "/steamapps" to the path
-                path = os.path.join(path, "steamapps")
 
-                # Add the path to the list of library folders if it exists
-                if os.path.exists(path):
-                    library_folders.append(path)
+# Function to check if a client icon was already downloaded
+def icon_exists(steamcmd_install_dir, client_icon_filename):
+    icon_file_path = get_icon_file_path(steamcmd_install_dir, client_icon_filename)
+    return os.path.exists(icon_file_path) and os.path.getsize(icon_file_path) > 0
 
-    # Return the list of library folders
-    return library_folders
 
+# Function to fetch the client icon file names of many games from the cache or the Steam API in batches
+# Returns a dict of app ID -> client icon file name, games missing from it need the SteamCMD fallback
+def fetch_client_icon_filenames(client, games, cache):
+    client_icons = {}
+
+    # Only ask Steam for games that are not in the cache
+    uncached_games = []
+    for game in games:
+        client_icon_filename = get_cached_client_icon(cache, game["appid"])
+        if client_icon_filename:
+            client_icons[game["appid"]] = client_icon_filename
+        else:
+            uncached_games.append(game)
+
+    if client_icons:
+        print(f"Found {len(client_icons)} client icons in the cache")
+
+    if not uncached_games:
+        return client_icons
+
+    if not client.connected:
+        print("[FAST] Not connected to Steam. Will use SteamCMD to get the app info")
+        return client_icons
+
+    # Only numeric app IDs can be sent to the Steam API
+    games = [game for game in uncached_games if game["appid"].isdigit()]
+
+    # Request the app info in chunks to stay under the Steam message size limits
+    chunks = [games[i:i + PRODUCT_INFO_CHUNK_SIZE] for i in range(0, len(games), PRODUCT_INFO_CHUNK_SIZE)]
+
+    def get_chunk_product_info(chunk):
+        try:
+            return client.get_product_info(apps=[int(game["appid"]) for game in chunk])
+        # gevent.Timeout is a BaseException, so it has to be caught explicitly
+        except (Exception, gevent.Timeout) as err:
+            print(f"[FAST] An error occurred: {err}")
+            return None
+
+    # SteamClient runs on gevent, so the chunks are requested concurrently from greenlets rather than threads
+    pool = Pool(PRODUCT_INFO_CONCURRENCY)
+    for chunk, app_info in zip(chunks, pool.imap(get_chunk_product_info, chunks)):
+        if not app_info:
+            print("[FAST] Unable to get product info for app IDs: ", ", ".join(game["appid"] for game in chunk))
+            continue
+
+        for game in chunk:
+            app_id = game["appid"]
+            app = app_info['apps'].get(int(app_id), {})
+            if 'common' in app and 'clienticon' in app['common']:
+                client_icon_filename = app['common']['clienticon']
+                client_icon_url = get_client_icon_url(app_id, client_icon_filename)
+
+                # Print the icon URL
+                print(
+                    f"[FAST] Client Icon URL for {game['name']} - {app_id}: {client_icon_url}"
+                )
+
+                client_icons[app_id] = client_icon_filename
+                set_cached_client_icon(cache, app_id, client_icon_filename)
+            else:
+                print("[FAST] Unable to find 'clienticon' in the app info for app ID: ", app_id)
+
+    return client_icons
+
+
+# Function to fetch the client icon file name by app ID with SteamCMD, returns None if it could not be found
+def fetch_icon_by_app_id(steamPath, app_id, game_name=None, failed_icons=None):
+    if failed_icons is None:
+        failed_icons = []
 
-# Function to fetch an icon by app ID
-def fetch_icon_by_app_id(client, steamPath, app_id, game_name=None, failed_icons=[]):
     # Define the default installation directory for SteamCMD
     # steamcmd_install_dir = os.path.join(
     #     os.getenv("ProgramFiles(x86)"), "Steam"
@@ -164,40 +367,9 @@ def fetch_icon_by_app_id(client, steamPath, app_id, game_name=None, failed_icons
 
     steamcmd_install_dir = steamPath
 
-    # Get the app info from the Steam API
-    if client.connected:
-        try:
-            app_info = client.get_product_info(apps=[int(app_id)])
-            if app_info:
-                app = app_info['apps'][int(app_id)]
-                if 'common' in app and 'clienticon' in app['common']:
-                    client_icon_filename = app['common']['clienticon']
-                    client_icon_url = f"https://cdn.cloudflare.steamstatic.com/steamcommunity/public/images/apps/{app_id}/{client_icon_filename}.ico"
-
-                    # Print the icon URL
-                    print(
-                        f"[FAST] Client Icon URL for {game_name} - {app_id}: {client_icon_url}"
-                    )
-
-                    download_icon(app_id, client_icon_filename, client_icon_url, failed_icons, game_name,
-                                  steamcmd_install_dir)
-
-                    return
-                else:
-                    print("[FAST] Unable to find 'clienticon' in the app info for app ID: ", app_id)
-            else:
-                print("[FAST] Unable to get product info for app ID: ", app_id)
-        except Exception as err:
-            print(f"[FAST] An error occurred: {err}")
-    else:
-        print("[FAST] Not connected to Steam. Will use SteamCMD to get the app info")
-
     # steamcmd.exe path
     steamcmd_exe_path = os.path.join(steamcmd_install_dir, "steamcmd.exe")
 
-    # Output file path
-    output_file = "steamcmd_output.txt"
-
     # If the steamcmd.exe directory does not exist, print an error message and exit
     if not os.path.exists(steamcmd_exe_path):
         print(f"SteamCMD not found in the following path: {steamcmd_install_dir}")
@@ -206,21 +378,20 @@ def fetch_icon_by_app_id(client, steamPath, app_id, game_name=None, failed_icons
         # Download SteamCMD
 
         try:
-            download_and_extract(
-                "https://steamcdn-a.akamaihd.net/client/installer/steamcmd.zip",
-                steamcmd_install_dir,
-            )
+            # The session is only needed for this one download, so it is created here
+            with create_http_session() as session:
+                download_and_extract(
+                    session,
+                    "https://steamcdn-a.akamaihd.net/client/installer/steamcmd.zip",
+                    steamcmd_install_dir,
+                )
 
             print("SteamCMD downloaded successfully")
 
-            steamcmd_command = (
-                f'"{steamcmd_exe_path}" +quit > {output_file} 2>&1'
-            )
-
             try:
-                # Run SteamCMD command and send the output to a file to force it to update
+                # Run SteamCMD once and discard the output to force it to update
                 print("Updating SteamCMD...")
-                subprocess.run(steamcmd_command, shell=True, check=True)
+                subprocess.run([steamcmd_exe_path, "+quit"], capture_output=True, check=True)
             except subprocess.CalledProcessError as e:
                 print(f"[Probably Ignore]Error: {e}")
 
@@ -231,99 +402,164 @@ def fetch_icon_by_app_id(client, steamPath, app_id, game_name=None, failed_icons
     else:
         print(f"SteamCMD found in the following path: {steamcmd_install_dir}")
 
+    # Define the SteamCMD command
+    # [steamcmd_exe_path, "+login", "anonymous", "+app_info_update", "1", "+app_info_print", str(app_id), "+quit"]
+    steamcmd_command = [
+        steamcmd_exe_path, *GGS, "+app_info_update", "1", "+app_info_print", str(app_id), *GGS, "+quit"
+    ]
 
-    #Prepare a string of +ggs with a fixed count of n. This is to let SteamCMD update itself
-    #and then update the app_info_print command to get the latest info
-
-    n = 10
-    ggs = ""
-    for i in range(n):
-        ggs += "+gg "
-
-    # Define the SteamCMD command and output file path
-    # f'"{steamcmd_exe_path}" +login anonymous +app_info_update 1 +app_info_print {app_id} +quit > {output_file} 2>&1'
-    steamcmd_command = (
-        # f'"{steamcmd_exe_path}" +app_info_print {app_id} +quit > {output_file} 2>&1'
-        f'"{steamcmd_exe_path}" {ggs} +app_info_update 1 +app_info_print {app_id} {ggs} +quit > {output_file} 2>&1'
-    )
+    client_icon_filename = None
 
     try:
-        # Run SteamCMD command and send the output to a file
-        subprocess.run(steamcmd_command, shell=True, check=True, close_fds=True, start_new_session=True)
+        # Run SteamCMD command and parse its output through a pipe as it arrives
+        with subprocess.Popen(
+            steamcmd_command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+            close_fds=True,
+            start_new_session=True,
+        ) as process:
+            # Kill SteamCMD if it hangs
+            watchdog = threading.Timer(STEAMCMD_TIMEOUT, process.kill)
+            watchdog.start()
 
-        # introduced a delay to allow the file to be written
-        time.sleep(1.5)
+            try:
+                # Loop over each line in the output
+                for line in process.stdout:
+                    # If the line contains the string "clienticon", extract the icon file name
+                    if '"clienticon"' in line:
+                        parts = line.strip().split('"')
+                        if len(parts) > 3:
+                            # Extract the icon file name
+                            client_icon_filename = parts[3]
+
+                            # Create the URL to download the icon from
+                            client_icon_url = get_client_icon_url(app_id, client_icon_filename)
+
+                            # Print the icon URL
+                            print(
+                                f"Client Icon URL for {game_name} - {app_id}: {client_icon_url}"
+                            )
+
+                            break
+            finally:
+                watchdog.cancel()
+
+                # Stop SteamCMD once the client icon was found, the rest of its output is not needed
+                if process.poll() is None:
+                    process.terminate()
+
+    except OSError as e:
+        print(f"Error: {e}")
 
-        # Read the output file
-        with open(output_file, "r", encoding="utf-8") as file:
-            lines = file.readlines()
-            #close file
-            file.close()
+    if not client_icon_filename:
+        print(
+            f"Client Icon URL for {game_name} - {app_id} not found in the SteamCMD output."
+        )
+        failed_icons.append(
+            {"appid": app_id, "name": game_name, "reason": "icon_not_found"}
+        )
 
+    return client_icon_filename
 
-        foundClientIcon = False
 
-        # Loop over each line in the output
-        for line in lines:
-            # If the line contains the string "clienticon", extract the icon file name
-            if '"clienticon"' in line:
-                parts = line.strip().split('"')
-                if len(parts) > 1:
-                    # Extract the icon file name
-                    client_icon_filename = parts[3]
+# Function to download a client icon once for all the games that share it
+async def download_icon_async(session, semaphore, games, client_icon_filename, client_icon_url, failed_icons,
+                              steamcmd_install_dir):
+    icon_file_path = get_icon_file_path(steamcmd_install_dir, client_icon_filename)
 
-                    # Create the URL to download the icon from
-                    client_icon_url = f"https://cdn.cloudflare.steamstatic.com/steamcommunity/public/images/apps/{app_id}/{client_icon_filename}.ico"
+    # Partial downloads go to a temporary file so an interrupted download never looks like a finished icon
+    partial_file_path = f"{icon_file_path}.part"
 
-                    # Print the icon URL
-                    print(
-                        f"Client Icon URL for {game_name} - {app_id}: {client_icon_url}"
-                    )
+    # Download the icon, limiting how many downloads are in flight at once
+    downloaded = False
+    async with semaphore:
+        try:
+            async with session.stream("GET", client_icon_url) as response:
+                if response.status_code == 200:
+                    os.makedirs(os.path.dirname(icon_file_path), exist_ok=True)
 
-                    foundClientIcon = True
+                    # Stream the icon to a file in chunks instead of holding the whole response in memory
+                    async with aiofiles.open(partial_file_path, "wb") as icon_file:
+                        async for chunk in response.aiter_bytes(ICON_CHUNK_SIZE):
+                            await icon_file.write(chunk)
 
-                    download_icon(app_id, client_icon_filename, client_icon_url, failed_icons, game_name,
-                                  steamcmd_install_dir)
+                    os.replace(partial_file_path, icon_file_path)
+                    downloaded = True
+        except (httpx.HTTPError, OSError) as err:
+            print(f"An error occurred while downloading {client_icon_url}: {err}")
 
-                    break
+            try:
+                if os.path.exists(partial_file_path):
+                    os.remove(partial_file_path)
+            except OSError as remove_err:
+                print(f"Failed to remove the partial download {partial_file_path}: {remove_err}")
 
-        if not foundClientIcon:
-            print(
-                f"Client Icon URL for {game_name} - {app_id} not found in the SteamCMD output."
-            )
+    if downloaded:
+        print(f"Client Icon saved to: {icon_file_path}")
+    else:
+        print(
+            f"Failed to download Client Icon from URL: {client_icon_url}"
+        )
+        for game in games:
             failed_icons.append(
-                {"appid": app_id, "name": game_name, "reason": "icon_not_found"}
+                {
+                    "appid": game["appid"],
+                    "name": game["name"],
+                    "reason": "failed_to_download",
+                }
             )
 
-    except subprocess.CalledProcessError as e:
-        print(f"Error: {e}")
 
+# Function to download all icons concurrently
+async def download_icons(icons, failed_icons, steamcmd_install_dir):
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+
+    # All icons come from the same CDN host, so HTTP/2 multiplexes the downloads over a single connection
+    limits = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+
+    async with httpx.AsyncClient(
+        http2=True,
+        limits=limits,
+        timeout=httpx.Timeout(HTTP_TIMEOUT[1], connect=HTTP_TIMEOUT[0]),
+        headers={"User-Agent": USER_AGENT},
+    ) as session:
+        tasks = [
+            download_icon_async(
+                session,
+                semaphore,
+                icon["games"],
+                icon["clienticon"],
+                get_client_icon_url(icon["games"][0]["appid"], icon["clienticon"]),
+                failed_icons,
+                steamcmd_install_dir,
+            )
+            for icon in icons
+        ]
 
-def download_icon(app_id, client_icon_filename, client_icon_url, failed_icons, game_name, steamcmd_install_dir):
-    # Download the icon
-    response = requests.get(client_icon_url)
-    if response.status_code == 200:
-        client_icon_filename = f"{client_icon_filename}.ico"
-        icon_file_path = os.path.join(
-            steamcmd_install_dir, "steam", "games", client_icon_filename
-        )
-        os.makedirs(os.path.dirname(icon_file_path), exist_ok=True)
+        # Use tqdm to create a progress bar that advances as each download finishes
+        for task in tqdm(asyncio.as_completed(tasks), total=len(tasks), desc="Downloading icons"):
+            await task
 
-        # Save the icon to a file
-        with open(icon_file_path, "wb") as icon_file:
-            icon_file.write(response.content)
-        print(f"Client Icon saved to: {icon_file_path}")
-    else:
-        print(
-            f"Failed to download Client Icon from URL: {client_icon_url}"
-        )
-        failed_icons.append(
-            {
-                "appid": app_id,
-                "name": game_name,
-                "reason": "failed_to_download",
-            }
-        )
+
+# Function to parse a Steam app manifest (.acf) file, returns None if it has no app ID and game name
+def _parse_acf(game_info_path):
+    # Open the .acf file and read its contents
+    with open(game_info_path, "rb") as file:
+        acf_content = file.read()
+
+    # Extract the app ID and game name from the file contents
+    match = ACF_RE.search(acf_content)
+    if not match:
+        return None
+
+    return {
+        "name": match.group(2).decode("utf-8", errors="replace"),
+        "appid": match.group(1).decode("ascii"),
+    }
 
 
 # Function to get list of Steam games in local libraries
@@ -334,32 +570,18 @@ def get_steam_games(steamPath, printFullList=True):
         print("No Steam library folders found.")
         return []
 
-    # Empty list to store games
-    all_games = []
-
-    # Loop over each library folder
+    # Collect the .acf files (Steam app manifest files) in every library folder
+    all_acf_paths = []
     for folder in library_folders:
-        # Get list of .acf files (Steam app manifest files) in the folder
-        file_list = os.listdir(folder)
-        acf_files = [file for file in file_list if file.endswith(".acf")]
-
-        # If there are .acf files, extract app IDs and game names
-        if acf_files:
-            for acf_file in acf_files:
-                # Open the .acf file and read its contents
-                game_info_path = os.path.join(folder, acf_file)
-                with open(game_info_path, "r", encoding="utf-8") as file:
-                    acf_content = file.read()
-
-                    # Extract the app ID and game name from the file contents
-                    match_name = re.search(r'"name"\s+"(.*?)"', acf_content)
-                    match_appid = re.search(r'"appid"\s+"(\d+)"', acf_content)
-
-                    # If both the app ID and game name were found, store them in the game list
-                    if match_name and match_appid:
-                        all_games.append(
-                            {"name": match_name.group(1), "appid": match_appid.group(1)}
-                        )
+        with os.scandir(folder) as entries:
+            all_acf_paths.extend(entry.path for entry in entries if entry.name.endswith(".acf"))
+
+    # Read the .acf files concurrently, as this is mostly waiting on the disk
+    with ThreadPoolExecutor(max_workers=MAX_ACF_READERS) as executor:
+        results = list(executor.map(_parse_acf, all_acf_paths))
+
+    # Keep the games where both the app ID and game name were found
+    all_games = [game for game in results if game]
 
     # If no games were found, print a message
     if not all_games:
@@ -403,6 +625,9 @@ def main():
 
     noIcon = False
 
+    # List of games to fetch icons for
+    games_to_fetch = []
+
     # If 'list' is specified, print list of installed games
     if "list" in app_ids and len(app_ids) == 1:
         all_games = get_steam_games(steam_path)
@@ -418,14 +643,15 @@ def main():
         # Print total number of games installed
         print(f"\nTotal number of games installed: {len(all_games)}")
 
-        # Use tqdm to wrap the for loop and create a progress bar
-        for game in tqdm(all_games, desc="Downloading icons"):
-            fetch_icon_by_app_id(client, steam_path, game["appid"], game["name"], failed_icons)
+        games_to_fetch = all_games
     else:
         games = get_steam_games(steam_path, False)
 
-        # Fetch icon for each given app_id
-        for app_id in tqdm(app_ids, desc="Downloading icons"):
+        # Index the installed games by app ID for quick lookups
+        games_by_id = {game["appid"]: game for game in games}
+
+        # Collect the game for each given app_id
+        for app_id in app_ids:
             # Check if the app_id is 228980, which is the app_id for Steam Common Redistributables (required by some games), if so, skip it
 
             if app_id == "228980":
@@ -434,15 +660,64 @@ def main():
                 )
                 continue
 
-            game = next((game for game in games if game["appid"] == app_id), None)
+            game = games_by_id.get(app_id)
 
             if game:
-                fetch_icon_by_app_id(client, steam_path, game["appid"], game["name"], failed_icons)
+                games_to_fetch.append(game)
             else:
                 print(
                     f"A game with app_id={app_id} was not found in your Steam libraries but I will try to download the icon anyway."
                 )
-                fetch_icon_by_app_id(client, steam_path, app_id, "", failed_icons)
+                games_to_fetch.append({"appid": app_id, "name": ""})
+
+    cache = load_cache()
+
+    # Leave out games whose cached client icon is already on disk, they need neither a Steam lookup nor a download
+    missing_games = []
+    for game in games_to_fetch:
+        client_icon_filename = get_cached_client_icon(cache, game["appid"])
+        if not client_icon_filename or not icon_exists(steam_path, client_icon_filename):
+            missing_games.append(game)
+
+    if len(missing_games) < len(games_to_fetch):
+        print(f"Skipping {len(games_to_fetch) - len(missing_games)} games whose icons were already downloaded")
+
+    # Look up the client icons of the remaining games from the cache or with batched Steam API calls first
+    client_icons = fetch_client_icon_filenames(client, missing_games, cache)
+
+    # Fall back to SteamCMD for games the Steam API did not return a client icon for
+    steamcmd_games = [game for game in missing_games if game["appid"] not in client_icons]
+    if steamcmd_games:
+        # Use tqdm to create a progress bar for the SteamCMD lookups, as these are the slow ones
+        for game in tqdm(steamcmd_games, desc="Fetching app info with SteamCMD"):
+            client_icon_filename = fetch_icon_by_app_id(
+                steam_path, game["appid"], game["name"], failed_icons
+            )
+            if client_icon_filename:
+                client_icons[game["appid"]] = client_icon_filename
+                set_cached_client_icon(cache, game["appid"], client_icon_filename)
+
+    # Icons to download keyed by client icon file name, apps sharing an icon (e.g. a game and its soundtrack)
+    # only download it once
+    icons = {}
+    for game in missing_games:
+        client_icon_filename = client_icons.get(game["appid"])
+        if not client_icon_filename:
+            continue
+
+        # Skip the download if the icon is already on disk, icon file names are unique per icon
+        if icon_exists(steam_path, client_icon_filename):
+            print(f"Client Icon for {game['name']} - {game['appid']} already exists, skipping download")
+        else:
+            icon = icons.setdefault(client_icon_filename, {"clienticon": client_icon_filename, "games": []})
+            icon["games"].append(game)
+
+    if missing_games:
+        save_cache(cache)
+
+    # Then download all the icons concurrently
+    if icons:
+        asyncio.run(download_icons(list(icons.values()), failed_icons, steam_path))
 
     # Remove 228980 from the failed icons list if it exists in the list
     failed_icons = [game for game in failed_icons if game["appid"] != "228980"]